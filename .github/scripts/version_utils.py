@@ -5,13 +5,62 @@ Version utilities for automated release workflow.
 This module provides utility functions for version management including:
 - Semantic version validation
 - Git tag existence checking
+- Batch validation and tag checking for multiple versions
 - Version comparison and validation
 """
 
-import re
-import subprocess
+import atexit
+import os
 import sys
-from typing import Optional, Tuple
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Dict, FrozenSet, List, NoReturn, Optional, Tuple
+
+# subprocess is imported where git is used, so commands that never spawn
+# git (e.g. `validate`) skip loading it at startup; argparse likewise is only
+# loaded by the CLI entry point
+if TYPE_CHECKING:
+    import argparse
+    import subprocess
+
+# Environment variable enabling the (network) remote tag check
+CHECK_REMOTE_ENV = "VERSION_UTILS_CHECK_REMOTE"
+
+
+@lru_cache(maxsize=256)
+def _parse_semver(version: str) -> Optional[Tuple[int, int, int]]:
+    """
+    Parse a strict X.Y.Z version string into a tuple of integers.
+    
+    Args:
+        version: Version string to parse (e.g., "1.2.3", "0.1.0")
+        
+    Returns:
+        tuple: (major, minor, patch) if version is valid, None otherwise
+    """
+    # Semantic version format: MAJOR.MINOR.PATCH with optional pre-release and build metadata
+    # For this project, we'll use strict format: X.Y.Z where X, Y, Z are non-negative integers
+    # without leading zeros
+    version = version.strip()
+    
+    # Cheap rejects first: "0.0.0" is the shortest valid version, and no
+    # realistic release number is longer than 32 characters
+    if not 5 <= len(version) <= 32 or not version[0].isdecimal():
+        return None
+    
+    major, sep1, rest = version.partition('.')
+    minor, sep2, patch = rest.partition('.')
+    
+    # A third '.' is left in patch and fails isdecimal()
+    if not (sep1 and sep2 and major.isdecimal() and minor.isdecimal() and patch.isdecimal()):
+        return None
+    if (
+        (len(major) > 1 and major[0] == '0')
+        or (len(minor) > 1 and minor[0] == '0')
+        or (len(patch) > 1 and patch[0] == '0')
+    ):
+        return None
+    
+    return (int(major), int(minor), int(patch))
 
 
 def validate_semantic_version(version: str) -> bool:
@@ -24,10 +73,20 @@ def validate_semantic_version(version: str) -> bool:
     Returns:
         bool: True if version is valid semantic version, False otherwise
     """
-    # Semantic version pattern: MAJOR.MINOR.PATCH with optional pre-release and build metadata
-    # For this project, we'll use strict format: X.Y.Z where X, Y, Z are non-negative integers
-    pattern = r'^(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)$'
-    return bool(re.match(pattern, version.strip()))
+    return _parse_semver(version) is not None
+
+
+def validate_many(versions: List[str]) -> List[bool]:
+    """
+    Validate several version strings at once.
+    
+    Args:
+        versions: Version strings to validate
+        
+    Returns:
+        list: Validation result for each version, in input order
+    """
+    return [_parse_semver(version) is not None for version in versions]
 
 
 def read_version_from_file(file_path: str = "VERSION") -> Optional[str]:
@@ -40,61 +99,179 @@ def read_version_from_file(file_path: str = "VERSION") -> Optional[str]:
     Returns:
         str: Version string if valid, None if file doesn't exist or invalid format
     """
+    # Probing for a missing file is a normal case, so check up front rather
+    # than paying for a FileNotFoundError
+    if not os.path.isfile(file_path):
+        print(f"Error: {file_path} file not found")
+        return None
+    
     try:
-        with open(file_path, 'r') as f:
-            version = f.read().strip()
-            
+        # VERSION is a few bytes, so read it with raw syscalls rather than
+        # building a buffered text file object around it
+        fd = os.open(file_path, os.O_RDONLY)
+        try:
+            chunks = [os.read(fd, 64)]
+            while len(chunks[-1]) == 64:
+                chunks.append(os.read(fd, 64))
+        finally:
+            os.close(fd)
+        
+        version = b"".join(chunks).decode('ascii', 'replace').strip()
+        
         if validate_semantic_version(version):
             return version
         else:
             print(f"Error: Invalid semantic version format in {file_path}: {version}")
             return None
             
-    except FileNotFoundError:
-        print(f"Error: {file_path} file not found")
-        return None
     except Exception as e:
         print(f"Error reading {file_path}: {e}")
         return None
 
 
-def git_tag_exists(version: str) -> bool:
+def _run(cmd: List[str]) -> Tuple[int, bytes]:
+    """
+    Run a command and capture its stdout.
+    
+    Only stdout is piped and stderr is discarded, so communicate() drains a
+    single pipe directly instead of needing reader threads for two.
+    
+    Args:
+        cmd: Command and arguments
+        
+    Returns:
+        tuple: (return code, stdout bytes)
+    """
+    import subprocess
+    
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    stdout, _ = process.communicate()
+    return process.returncode, stdout
+
+
+@lru_cache(maxsize=1)
+def _git_command() -> Tuple[str, ...]:
+    """
+    Build the git command prefix, resolving the repository only once.
+    
+    Passing --git-dir explicitly lets every later git process skip its own
+    upward search for the repository. The lookup happens on first git use,
+    so commands that never touch git don't pay for it.
+    
+    Returns:
+        tuple: Command prefix, e.g. ("git", "--git-dir", "/repo/.git")
+    """
+    # An exported GIT_DIR already disables discovery in child processes
+    if os.environ.get("GIT_DIR"):
+        return ("git",)
+    
+    returncode, stdout = _run(["git", "rev-parse", "--absolute-git-dir"])
+    
+    git_dir = stdout.decode().strip()
+    if returncode != 0 or not git_dir:
+        return ("git",)
+    
+    return ("git", "--git-dir", git_dir)
+
+
+@lru_cache(maxsize=1)
+def _local_tags() -> FrozenSet[str]:
+    """
+    List local tag refs with a single `git for-each-ref` call.
+    
+    The listing is cached for the lifetime of the process, so every later
+    tag check is a set lookup. Tags created after the first call are not seen.
+    
+    Returns:
+        frozenset: Full ref names of local tags (e.g., "refs/tags/v1.2.3")
+    """
+    import subprocess
+    
+    cmd = [*_git_command(), "for-each-ref", "--format=%(refname)", "refs/tags/"]
+    returncode, stdout = _run(cmd)
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd)
+    
+    return frozenset(stdout.decode().split())
+
+
+def git_tag_exists(version: str) -> Optional[bool]:
     """
     Check if a git tag already exists for the given version.
     
+    Only local refs are checked by default, so a tag that was never fetched
+    is reported as missing. Run `git fetch --tags` first, or set
+    VERSION_UTILS_CHECK_REMOTE=1 to also query the origin remote.
+    The local tag listing is cached for the lifetime of the process.
+    
     Args:
         version: Version string (will be prefixed with 'v' for tag check)
         
     Returns:
-        bool: True if tag exists, False otherwise
+        bool: True if tag exists, False otherwise, None if the check failed
     """
+    import subprocess
+    
     tag_name = f"v{version}"
     
     try:
         # Check if tag exists locally
-        result = subprocess.run(
-            ["git", "tag", "-l", tag_name],
-            capture_output=True,
-            text=True,
-            check=False
-        )
-        
-        if result.returncode == 0 and result.stdout.strip():
+        if f"refs/tags/{tag_name}" in _local_tags():
             return True
-            
-        # Also check remote tags to be thorough
-        result = subprocess.run(
-            ["git", "ls-remote", "--tags", "origin", tag_name],
-            capture_output=True,
-            text=True,
-            check=False
-        )
         
-        return result.returncode == 0 and result.stdout.strip() != ""
+        # The remote check is a network round-trip, so it is opt-in
+        if os.environ.get(CHECK_REMOTE_ENV) != "1":
+            return False
+        
+        cmd = [*_git_command(), "ls-remote", "--tags", "origin", tag_name]
+        returncode, stdout = _run(cmd)
+        if returncode != 0:
+            raise subprocess.CalledProcessError(returncode, cmd)
+        
+        return stdout.strip() != b""
+        
+    except Exception as e:
+        # Not knowing must not look like "tag is free" to release tooling
+        print(f"Error checking git tag existence: {e}")
+        return None
+
+
+def check_tags_many(versions: List[str]) -> Dict[str, Optional[bool]]:
+    """
+    Check git tag existence for several versions at once.
+    
+    Local tags are listed once with `git for-each-ref`; when
+    VERSION_UTILS_CHECK_REMOTE=1 is set, remote tags are listed once with
+    `git ls-remote` as well. The number of git calls does not grow with
+    the number of versions.
+    
+    Args:
+        versions: Version strings (each will be prefixed with 'v' for tag check)
+        
+    Returns:
+        dict: Mapping of each version to True if its tag exists, False if it
+            does not, or None for every version if the tags could not be listed
+    """
+    import subprocess
+    
+    try:
+        tags = set(_local_tags())
+        
+        if os.environ.get(CHECK_REMOTE_ENV) == "1":
+            cmd = [*_git_command(), "ls-remote", "--tags", "origin"]
+            returncode, stdout = _run(cmd)
+            if returncode != 0:
+                raise subprocess.CalledProcessError(returncode, cmd)
+            # Lines are "<sha>\t<ref>"; annotated tags also list "<ref>^{}"
+            for line in stdout.decode().splitlines():
+                _, _, ref = line.partition("\t")
+                tags.add(ref[:-3] if ref.endswith("^{}") else ref)
         
     except Exception as e:
         print(f"Error checking git tag existence: {e}")
-        return False
+        return {version: None for version in versions}
+    
+    return {version: f"refs/tags/v{version}" in tags for version in versions}
 
 
 def compare_versions(version1: str, version2: str) -> int:
@@ -108,22 +285,82 @@ def compare_versions(version1: str, version2: str) -> int:
     Returns:
         int: -1 if version1 < version2, 0 if equal, 1 if version1 > version2
     """
-    if not validate_semantic_version(version1) or not validate_semantic_version(version2):
+    v1_parts = _parse_semver(version1)
+    v2_parts = _parse_semver(version2)
+    
+    if v1_parts is None or v2_parts is None:
         raise ValueError("Both versions must be valid semantic versions")
     
-    def parse_version(version: str) -> Tuple[int, int, int]:
-        parts = version.split('.')
-        return (int(parts[0]), int(parts[1]), int(parts[2]))
+    return (v1_parts > v2_parts) - (v1_parts < v2_parts)
+
+
+class _CatFile:
+    """
+    Long-running `git cat-file --batch` process for reading blobs.
     
-    v1_parts = parse_version(version1)
-    v2_parts = parse_version(version2)
+    The process is started on first use and reused for every later lookup,
+    so reading many `<commit>:<path>` blobs costs a single git exec.
+    """
     
-    if v1_parts < v2_parts:
-        return -1
-    elif v1_parts > v2_parts:
-        return 1
-    else:
-        return 0
+    def __init__(self):
+        self._process: Optional[subprocess.Popen] = None
+    
+    def read(self, rev: str) -> Optional[Tuple[str, bytes]]:
+        """
+        Read the object id and contents of a blob.
+        
+        Args:
+            rev: Object name understood by git (e.g., "HEAD:VERSION")
+            
+        Returns:
+            tuple: (object id, contents), None if the object does not exist
+            
+        Raises:
+            ValueError: If rev contains whitespace, which would desync the
+                line-based batch protocol
+        """
+        if not rev or any(c.isspace() for c in rev):
+            raise ValueError(f"Invalid git object name: {rev!r}")
+        
+        if self._process is None or self._process.poll() is not None:
+            import subprocess
+            
+            self._process = subprocess.Popen(
+                [*_git_command(), "cat-file", "--batch"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL
+            )
+        
+        self._process.stdin.write(f"{rev}\n".encode())
+        self._process.stdin.flush()
+        
+        # Header is "<sha> <type> <size>", or "<rev> missing" for unknown objects
+        header = self._process.stdout.readline()
+        if not header:
+            raise RuntimeError("git cat-file exited unexpectedly")
+        
+        fields = header.split()
+        if len(fields) != 3:
+            return None
+        
+        size = int(fields[2])
+        # Contents are followed by a single LF
+        return fields[0].decode(), self._process.stdout.read(size + 1)[:size]
+    
+    def close(self) -> None:
+        """
+        Stop the underlying git process if it is running.
+        """
+        if self._process is not None:
+            self._process.stdin.close()
+            self._process.wait()
+            self._process.stdout.close()
+            self._process = None
+
+
+_cat_file = _CatFile()
+atexit.register(_cat_file.close)
 
 
 def get_git_commit_version_change(commit_hash: str = "HEAD") -> Optional[str]:
@@ -137,26 +374,29 @@ def get_git_commit_version_change(commit_hash: str = "HEAD") -> Optional[str]:
         str: New version if VERSION file changed, None otherwise
     """
     try:
-        # Check if VERSION file was modified in the commit
-        result = subprocess.run(
-            ["git", "diff", "--name-only", f"{commit_hash}^", commit_hash],
-            capture_output=True,
-            text=True,
-            check=True
-        )
+        if _cat_file.read(f"{commit_hash}^{{commit}}") is None:
+            print(f"Error checking git commit changes: cannot resolve commit {commit_hash}")
+            return None
+        
+        # A missing parent (root commit, or the boundary of a shallow clone)
+        # says nothing about VERSION, so it must not count as an addition
+        if _cat_file.read(f"{commit_hash}^") is None:
+            print(f"Error checking git commit changes: parent of {commit_hash} is not available")
+            return None
         
-        changed_files = result.stdout.strip().split('\n')
+        # VERSION changed if its blob differs from the parent's; both blobs
+        # come from the same cat-file process, so no git exec per call
+        old = _cat_file.read(f"{commit_hash}^:VERSION")
+        new = _cat_file.read(f"{commit_hash}:VERSION")
         
-        if "VERSION" in changed_files:
-            # Get the new version from the commit
-            result = subprocess.run(
-                ["git", "show", f"{commit_hash}:VERSION"],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            
-            version = result.stdout.strip()
+        if new is None:
+            if old is not None:
+                print(f"Error: VERSION file not found in commit {commit_hash}")
+            return None
+        
+        # The parent exists, so a missing old blob means VERSION was added
+        if old is None or old[0] != new[0]:
+            version = new[1].decode().strip()
             if validate_semantic_version(version):
                 return version
             else:
@@ -165,7 +405,7 @@ def get_git_commit_version_change(commit_hash: str = "HEAD") -> Optional[str]:
         
         return None
         
-    except subprocess.CalledProcessError as e:
+    except (OSError, ValueError) as e:
         print(f"Error checking git commit changes: {e}")
         return None
     except Exception as e:
@@ -173,6 +413,124 @@ def get_git_commit_version_change(commit_hash: str = "HEAD") -> Optional[str]:
         return None
 
 
+def _finish(code: int, message: Optional[str] = None) -> NoReturn:
+    """
+    Write the final message of a command and exit immediately.
+    
+    Uses os._exit() to skip atexit handlers and interpreter teardown, which
+    dominate the runtime of these short-lived commands. Buffered output is
+    flushed explicitly since os._exit() does not; the cat-file reader is not
+    closed, its git process exits on its own once stdin hits EOF.
+    
+    Args:
+        code: Process exit code
+        message: Optional line to print before exiting
+    """
+    if message is not None:
+        sys.stdout.write(message + "\n")
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os._exit(code)
+
+
+def _cmd_validate(args: "argparse.Namespace") -> None:
+    """Handle `validate <version>`."""
+    if validate_semantic_version(args.version):
+        _finish(0, f"✓ Version {args.version} is valid")
+    else:
+        _finish(1, f"✗ Version {args.version} is invalid")
+
+
+def _cmd_check_tag(args: "argparse.Namespace") -> None:
+    """Handle `check-tag <version>`."""
+    exists = git_tag_exists(args.version)
+    if exists is None:
+        _finish(1, f"✗ Could not check whether tag v{args.version} exists")
+    elif exists:
+        _finish(1, f"✗ Tag v{args.version} already exists")
+    else:
+        where = "locally or on origin" if os.environ.get(CHECK_REMOTE_ENV) == "1" else "locally"
+        _finish(0, f"✓ Tag v{args.version} does not exist {where}")
+
+
+def _cmd_read_version(args: "argparse.Namespace") -> None:
+    """Handle `read-version [file]`."""
+    version = read_version_from_file(args.file)
+    if version:
+        _finish(0, version)
+    else:
+        _finish(1)
+
+
+def _cmd_compare(args: "argparse.Namespace") -> None:
+    """Handle `compare <v1> <v2>`."""
+    v1, v2 = args.version1, args.version2
+    try:
+        result = compare_versions(v1, v2)
+    except ValueError as e:
+        _finish(1, f"Error: {e}")
+    
+    if result == -1:
+        _finish(0, f"{v1} < {v2}")
+    elif result == 0:
+        _finish(0, f"{v1} = {v2}")
+    else:
+        _finish(0, f"{v1} > {v2}")
+
+
+def _cmd_check_commit(args: "argparse.Namespace") -> None:
+    """Handle `check-commit [hash]`."""
+    version = get_git_commit_version_change(args.hash)
+    if version:
+        _finish(0, version)
+    else:
+        _finish(1, "No version change detected")
+
+
+_COMMANDS: Dict[str, Callable[["argparse.Namespace"], None]] = {
+    "validate": _cmd_validate,
+    "check-tag": _cmd_check_tag,
+    "read-version": _cmd_read_version,
+    "compare": _cmd_compare,
+    "check-commit": _cmd_check_commit,
+}
+
+
+def _build_parser() -> "argparse.ArgumentParser":
+    """
+    Build the command-line parser with one subparser per command.
+    
+    Returns:
+        argparse.ArgumentParser: Parser whose `command` is a key of _COMMANDS
+    """
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Version utilities for automated release workflow.")
+    sub = parser.add_subparsers(dest="command", metavar="<command>")
+    
+    cmd = sub.add_parser("validate", help="Validate semantic version format")
+    cmd.add_argument("version")
+    
+    cmd = sub.add_parser(
+        "check-tag",
+        help="Check if git tag exists for version (local tags only: run `git fetch --tags` "
+             f"first or set {CHECK_REMOTE_ENV}=1 to also query origin)"
+    )
+    cmd.add_argument("version")
+    
+    cmd = sub.add_parser("read-version", help="Read and validate version from file")
+    cmd.add_argument("file", nargs="?", default="VERSION")
+    
+    cmd = sub.add_parser("compare", help="Compare two versions")
+    cmd.add_argument("version1")
+    cmd.add_argument("version2")
+    
+    cmd = sub.add_parser("check-commit", help="Check if VERSION changed in commit")
+    cmd.add_argument("hash", nargs="?", default="HEAD")
+    
+    return parser
+
+
 def main():
     """
     Command-line interface for version utilities.
@@ -183,86 +541,15 @@ def main():
         python version_utils.py read-version
         python version_utils.py compare 1.2.3 1.3.0
     """
-    if len(sys.argv) < 2:
-        print("Usage: python version_utils.py <command> [args...]")
-        print("Commands:")
-        print("  validate <version>     - Validate semantic version format")
-        print("  check-tag <version>    - Check if git tag exists for version")
-        print("  read-version [file]    - Read and validate version from file")
-        print("  compare <v1> <v2>      - Compare two versions")
-        print("  check-commit [hash]    - Check if VERSION changed in commit")
-        sys.exit(1)
-    
-    command = sys.argv[1]
+    parser = _build_parser()
+    args = parser.parse_args()
     
-    if command == "validate":
-        if len(sys.argv) != 3:
-            print("Usage: python version_utils.py validate <version>")
-            sys.exit(1)
-        
-        version = sys.argv[2]
-        if validate_semantic_version(version):
-            print(f"✓ Version {version} is valid")
-            sys.exit(0)
-        else:
-            print(f"✗ Version {version} is invalid")
-            sys.exit(1)
-    
-    elif command == "check-tag":
-        if len(sys.argv) != 3:
-            print("Usage: python version_utils.py check-tag <version>")
-            sys.exit(1)
-        
-        version = sys.argv[2]
-        if git_tag_exists(version):
-            print(f"✗ Tag v{version} already exists")
-            sys.exit(1)
-        else:
-            print(f"✓ Tag v{version} does not exist")
-            sys.exit(0)
-    
-    elif command == "read-version":
-        file_path = sys.argv[2] if len(sys.argv) > 2 else "VERSION"
-        version = read_version_from_file(file_path)
-        if version:
-            print(version)
-            sys.exit(0)
-        else:
-            sys.exit(1)
-    
-    elif command == "compare":
-        if len(sys.argv) != 4:
-            print("Usage: python version_utils.py compare <version1> <version2>")
-            sys.exit(1)
-        
-        v1, v2 = sys.argv[2], sys.argv[3]
-        try:
-            result = compare_versions(v1, v2)
-            if result == -1:
-                print(f"{v1} < {v2}")
-            elif result == 0:
-                print(f"{v1} = {v2}")
-            else:
-                print(f"{v1} > {v2}")
-            sys.exit(0)
-        except ValueError as e:
-            print(f"Error: {e}")
-            sys.exit(1)
-    
-    elif command == "check-commit":
-        commit_hash = sys.argv[2] if len(sys.argv) > 2 else "HEAD"
-        version = get_git_commit_version_change(commit_hash)
-        if version:
-            print(version)
-            sys.exit(0)
-        else:
-            print("No version change detected")
-            sys.exit(1)
-    
-    else:
-        print(f"Unknown command: {command}")
+    if args.command is None:
+        parser.print_help()
         sys.exit(1)
+    
+    _COMMANDS[args.command](args)
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()